@@ -20,7 +20,9 @@ import numpy as np
 import sklearn.cluster
 from cartopy.io.img_tiles import GoogleTiles
 from matplotlib.axes import Axes
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 
 from skfda.datasets import fetch_aemet
 from skfda.exploratory.depth import ModifiedBandDepth
@@ -52,7 +54,12 @@ from skfda.preprocessing.dim_reduction import FPCA
 
 # %%
 # We first load the AEMET dataset and plot it.
-X, _ = fetch_aemet(return_X_y=True)
+# The dataset is fetched only once, as a Pandas dataframe, from which both
+# the temperature curves and the station coordinates used later are
+# extracted.
+aemet, _ = fetch_aemet(return_X_y=True, as_frame=True)
+
+X = aemet.loc[:, "daily averages"].values
 X = X.coordinates[0]
 
 X.plot()
@@ -98,20 +105,21 @@ fda_clusters = fda_kmeans.fit_predict(X)
 coords_spain = (-10, 5, 34.98, 44.8)
 coords_canary = (-18.5, -13, 27.5, 29.5)
 
-# It is easier to obtain the longitudes and latitudes from the data in
-# a Pandas dataframe.
-aemet, _ = fetch_aemet(return_X_y=True, as_frame=True)
-
 station_longitudes = aemet.loc[:, "longitude"].values
 station_latitudes = aemet.loc[:, "latitude"].values
 
 
+# A single tiler shared by every map, with the downloaded tiles cached
+# on disk, so each tile is fetched and decoded only once even though
+# four maps are drawn.
+tiler = GoogleTiles(style="satellite", cache=True)
+
+
 def create_map(
     coords: Tuple[float, float, float, float],
     figsize: Tuple[float, float],
 ) -> Figure:
     """Create a map for a region of the world."""
-    tiler = GoogleTiles(style="satellite")
     mercator = tiler.crs
 
     fig = plt.figure(figsize=figsize)
@@ -132,16 +140,21 @@ def plot_cluster_points(
     ax: Axes,
 ) -> None:
     """Plot the stations in a map with their cluster color."""
-    for cluster in range(n_clusters):
-        selection = (clusters == cluster)
-        ax.scatter(
-            longitudes[selection],
-            latitudes[selection],
-            s=64,
-            color=color_map[cluster],
-            edgecolors='white',
-            transform=ccrs.Geodetic(),
-        )
+    # A single scatter call with a per-station color array adds one
+    # PathCollection instead of one per cluster.
+    palette = np.array([
+        to_rgba(color_map[cluster])
+        for cluster in range(n_clusters)
+    ])
+
+    ax.scatter(
+        longitudes,
+        latitudes,
+        s=64,
+        color=palette[clusters],
+        edgecolors='white',
+        transform=ccrs.Geodetic(),
+    )
 
 
 # Colors for each cluster
@@ -213,11 +226,10 @@ plt.show()
 fpca = FPCA(n_components=2)
 fpca.fit(X)
 
-# The sign of the components is arbitrary, but this way it is easier to
-# understand.
-fpca.components_ *= -1
-
-X_red = fpca.transform(X)
+# The sign of the components is arbitrary; flipping it makes them easier
+# to understand. The flip is applied where the components and projections
+# are used, keeping the fitted estimator untouched.
+X_red = -fpca.transform(X)
 
 # %%
 # We now plot the first two principal components as perturbations over the
@@ -233,7 +245,7 @@ X_red = fpca.transform(X)
 fig = plt.figure(figsize=(8, 4))
 FPCAPlot(
     fpca.mean_,
-    fpca.components_,
+    -fpca.components_,
     factor=50,
     fig=fig,
 ).plot()
@@ -249,26 +261,41 @@ plt.show()
 # located at the strait of Gibraltar and thus receives also the cold
 # waters of the Atlantic, explaining its lower annual variability.
 fig, ax = plt.subplots(1, 1)
-for cluster in range(n_clusters):
-    selection = fda_clusters == cluster
-    ax.scatter(
-        X_red[selection, 0],
-        X_red[selection, 1],
-        color=fda_color_map[cluster],
-        label=climate_names[cluster],
-    )
+fda_palette = np.array([
+    to_rgba(fda_color_map[cluster])
+    for cluster in range(n_clusters)
+])
+ax.scatter(
+    X_red[:, 0],
+    X_red[:, 1],
+    color=fda_palette[fda_clusters],
+)
 
 ax.set_xlabel('First principal component')
 ax.set_ylabel('Second principal component')
-ax.legend()
+ax.legend(handles=[
+    Line2D(
+        [],
+        [],
+        marker='o',
+        linestyle='',
+        color=fda_palette[cluster],
+        label=climate_names[cluster],
+    )
+    for cluster in range(n_clusters)
+])
 plt.show()
 
 # %%
 # We now attempt a multivariate clustering using only these projections.
+# Elkan's algorithm exploits the triangle inequality to skip most
+# distance computations on low-dimensional dense data such as these
+# two-dimensional projections.
 mv_kmeans = sklearn.cluster.KMeans(
     n_clusters=n_clusters,
     n_init=n_init,
     random_state=0,
+    algorithm="elkan",
 )
 mv_clusters = mv_kmeans.fit_predict(X_red)
 
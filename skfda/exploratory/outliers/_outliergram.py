@@ -1,12 +1,62 @@
 from __future__ import annotations
 
+from typing import Tuple
+
 import numpy as np
+from scipy.special import comb
 
 from ..._utils._sklearn_adapter import BaseEstimator, OutlierMixin
+from ..._utils.ndfunction import average_function_value
 from ...representation import FDataGrid
-from ...typing._numpy import NDArrayFloat, NDArrayInt
-from ..depth._depth import ModifiedBandDepth
-from ..stats import modified_epigraph_index
+from ...typing._numpy import DTypeLike, NDArrayFloat, NDArrayInt
+from ..depth.multivariate import _searchsorted_ordered
+
+
+def _mbd_mei(X: FDataGrid) -> Tuple[NDArrayFloat, NDArrayFloat]:
+    """
+    Compute jointly the MBD and the MEI of a FDataGrid.
+
+    Both quantities are derived from the pointwise ranks of the curves,
+    so computing them together performs the (dominant) ranking step only
+    once, instead of once per statistic as in
+    :class:`~skfda.exploratory.depth.ModifiedBandDepth` and
+    :func:`~skfda.exploratory.stats.modified_epigraph_index`.
+
+    """
+    n_samples = X.n_samples
+
+    # A single sort per grid point; the pointwise counts for both
+    # statistics are then obtained by binary search, instead of one
+    # full ranking per statistic.
+    values = np.moveaxis(X.data_matrix, 0, -1)
+    sorted_values = np.sort(values, axis=-1)
+
+    num_strictly_below = np.moveaxis(
+        _searchsorted_ordered(sorted_values, values),
+        -1,
+        0,
+    )
+    num_strictly_above = n_samples - np.moveaxis(
+        _searchsorted_ordered(sorted_values, values, side='right'),
+        -1,
+        0,
+    )
+
+    total_pairs = comb(n_samples, 2)
+
+    mbd_pointwise = (
+        total_pairs - comb(num_strictly_below, 2)
+        - comb(num_strictly_above, 2)
+    ) / total_pairs
+
+    # Number of curves above each point, counting ties but not the
+    # curve itself.
+    mei_pointwise = (n_samples - 1 - num_strictly_below) / n_samples
+
+    mbd = average_function_value(X.copy(data_matrix=mbd_pointwise)).ravel()
+    mei = average_function_value(X.copy(data_matrix=mei_pointwise)).ravel()
+
+    return mbd, mei
 
 
 class OutliergramOutlierDetector(
@@ -23,6 +73,10 @@ class OutliergramOutlierDetector(
 
     Parameters:
         factor (float): The number of times the IQR is multiplied.
+        dtype: Dtype used to store the fitted MBD, MEI and distance
+            arrays. As both statistics lie in :math:`[0, 1]`, a
+            ``np.float32`` dtype halves the memory footprint for large
+            datasets at a negligible precision cost.
 
     Example:
         Function :math:`f : \mathbb{R}\longmapsto\mathbb{R}`.
@@ -51,27 +105,50 @@ class OutliergramOutlierDetector(
 
     """
 
-    def __init__(self, *, factor: float = 1.5) -> None:
+    def __init__(
+        self,
+        *,
+        factor: float = 1.5,
+        dtype: DTypeLike = np.float64,
+    ) -> None:
         self.factor = factor
+        self.dtype = dtype
 
-    def _compute_parabola(self, X: FDataGrid) -> NDArrayFloat:
-        """Compute the parabola in which pairs (mei, mbd) should lie."""
-        a_0 = -2 / (X.n_samples * (X.n_samples - 1))
-        a_1 = (2 * (X.n_samples + 1)) / (X.n_samples - 1)
-        a_2 = a_0
+    def _compute_distances(self, X: FDataGrid) -> NDArrayFloat:
+        """Compute the vertical distances to the outliergram parabola.
+
+        The parabola is the curve in which pairs (mei, mbd) should lie.
+        Its coefficients share the common factor 2/(n(n-1)), so the
+        polynomial is evaluated in the factored Horner form
+        2/(n(n-1)) (-1 + n mei ((n + 1) - n mei)) and fused with the
+        subtraction of the MBD, avoiding the allocation of intermediate
+        arrays for the parabola values.
+        """
+        n_samples = X.n_samples
+        scale = 2 / (n_samples * (n_samples - 1))
 
         return (
-            a_0 + a_1 * self.mei_
-            + X.n_samples**2 * a_2 * self.mei_**2
+            scale * (
+                -1 + n_samples * self.mei_
+                * ((n_samples + 1) - n_samples * self.mei_)
+            )
+            - self.mbd_
         )
 
+    @property
+    def parabola_(self) -> NDArrayFloat:
+        """Parabola values at the fitted MEI, kept for backwards compat."""
+        return self.distances_ + self.mbd_
+
     def _compute_maximum_inlier_distance(
         self,
         distances: NDArrayFloat,
     ) -> float:
         """Compute the distance above which data are considered outliers."""
-        first_quartile = np.percentile(distances, 25)  # noqa: WPS432
-        third_quartile = np.percentile(distances, 75)  # noqa: WPS432
+        first_quartile, third_quartile = np.quantile(
+            distances,
+            (0.25, 0.75),  # noqa: WPS432
+        )
         iqr = third_quartile - first_quartile
         return float(third_quartile + self.factor * iqr)
 
@@ -80,13 +157,15 @@ class OutliergramOutlierDetector(
         X: FDataGrid,
         y: object = None,
     ) -> OutliergramOutlierDetector:
-        self.mbd_ = ModifiedBandDepth()(X)
-        self.mei_ = modified_epigraph_index(X)
-        self.parabola_ = self._compute_parabola(X)
-        self.distances_ = self.parabola_ - self.mbd_
+        mbd, mei = _mbd_mei(X)
+        self.mbd_ = mbd.astype(self.dtype, copy=False)
+        self.mei_ = mei.astype(self.dtype, copy=False)
+        self.distances_ = self._compute_distances(X)
         self.max_inlier_distance_ = self._compute_maximum_inlier_distance(
             self.distances_,
         )
+        self.outliers_ = self.distances_ > self.max_inlier_distance_
+        self.n_outliers_ = int(np.count_nonzero(self.outliers_))
 
         return self
 
@@ -97,7 +176,8 @@ class OutliergramOutlierDetector(
     ) -> NDArrayInt:
         self.fit(X, y)
 
-        outliers = self.distances_ > self.max_inlier_distance_
-
         # Predict as scikit-learn outlier detectors
-        return ~outliers + outliers * -1
+        if self.n_outliers_ == 0:
+            return np.ones(X.n_samples, dtype=int)
+
+        return np.where(self.outliers_, -1, 1)
@@ -8,11 +8,13 @@ from typing import Sequence, Tuple, TypeVar, Union
 
 import matplotlib.backends.backend_svg
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from typing_extensions import Protocol, TypeAlias
 
 from ...representation._functional_data import FData
+from ...typing._numpy import NDArrayFloat
 
 non_close_text = '[^>]*?'
 svg_width_regex = re.compile(
@@ -315,9 +317,90 @@ def _change_luminosity(color: ColorLike, amount: float = 0.5) -> ColorLike:
     return colorsys.hls_to_rgb(c[0], new_lightness, c[2])
 
 
+def _change_luminosity_array(
+    colors: NDArrayFloat,
+    amount: float = 0.5,
+) -> NDArrayFloat:
+    """
+    Change the luminosity of an (n, 3) or (n, 4) RGB(A) array at once.
+
+    Vectorized equivalent of applying :func:`_change_luminosity` to each
+    row, avoiding the per-color Python-level HLS round trip.
+    """
+    import matplotlib.colors as mc
+
+    rgba = mc.to_rgba_array(colors)
+    rgb = rgba[:, :3]
+
+    # RGB -> HLS, following colorsys.rgb_to_hls.
+    maxc = rgb.max(axis=-1)
+    minc = rgb.min(axis=-1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    gray = rangec == 0
+
+    lightness = sumc / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        saturation = np.where(
+            lightness <= 0.5,  # noqa: WPS459
+            rangec / sumc,
+            rangec / (2 - sumc),
+        )
+        channel_pos = (maxc[:, np.newaxis] - rgb) / rangec[:, np.newaxis]
+    saturation[gray] = 0
+    channel_pos[gray] = 0
+
+    red_pos, green_pos, blue_pos = channel_pos.T
+    hue = np.select(
+        [rgb[:, 0] == maxc, rgb[:, 1] == maxc],
+        [blue_pos - green_pos, 2 + red_pos - blue_pos],
+        default=4 + green_pos - red_pos,
+    )
+    hue = (hue / 6) % 1
+
+    intensity = (amount - 0.5) * 2
+    if intensity > 0:
+        lightness += intensity * (1 - lightness)
+    else:
+        lightness += intensity * lightness
+
+    # HLS -> RGB, following colorsys.hls_to_rgb.
+    m2 = np.where(
+        lightness <= 0.5,  # noqa: WPS459
+        lightness * (1 + saturation),
+        lightness + saturation - lightness * saturation,
+    )
+    m1 = 2 * lightness - m2
+
+    def _channel_value(hue: NDArrayFloat) -> NDArrayFloat:
+        hue = hue % 1
+        return np.select(
+            [hue < 1 / 6, hue < 1 / 2, hue < 2 / 3],  # noqa: WPS432
+            [
+                m1 + (m2 - m1) * hue * 6,
+                m2,
+                m1 + (m2 - m1) * (2 / 3 - hue) * 6,
+            ],
+            default=m1,
+        )
+
+    rgba[:, 0] = _channel_value(hue + 1 / 3)
+    rgba[:, 1] = _channel_value(hue)
+    rgba[:, 2] = _channel_value(hue - 1 / 3)
+
+    return rgba
+
+
 def _darken(color: ColorLike, amount: float = 0) -> ColorLike:
     return _change_luminosity(color, 0.5 - amount / 2)
 
 
+def _darken_array(
+    colors: NDArrayFloat,
+    amount: float = 0,
+) -> NDArrayFloat:
+    return _change_luminosity_array(colors, 0.5 - amount / 2)
+
+
 def _lighten(color: ColorLike, amount: float = 0) -> ColorLike:
     return _change_luminosity(color, 0.5 + amount / 2)
@@ -10,9 +10,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.artist import Artist
 from matplotlib.axes import Axes
-from matplotlib.collections import PatchCollection
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.patches import Rectangle
 from matplotlib.ticker import MaxNLocator
 from sklearn.exceptions import NotFittedError
 from sklearn.utils.validation import check_is_fitted
@@ -22,7 +21,7 @@ from ...misc.validation import check_fdata_same_dimensions
 from ...representation import FData, FDataGrid
 from ...typing._numpy import NDArrayFloat, NDArrayInt
 from ._baseplot import BasePlot
-from ._utils import ColorLike, _darken, _set_labels
+from ._utils import ColorLike, _darken_array, _set_labels
 
 
 class ClusteringEstimator(Protocol):
@@ -112,6 +111,40 @@ def _plot_clustering_checks(
         )
 
 
+def _get_cluster_colors(
+    colormap: matplotlib.colors.Colormap,
+    n_clusters: int,
+) -> NDArrayFloat:
+    """Take one color per cluster, evenly spaced in the colormap."""
+    return colormap(np.linspace(0, 1, n_clusters))
+
+
+def _fit_if_needed(
+    estimator: ClusteringEstimator,
+    fdata: FData,
+) -> None:
+    """Fit the estimator to the data unless it is already fitted to it."""
+    try:
+        check_is_fitted(estimator)
+        check_fdata_same_dimensions(
+            estimator.cluster_centers_,
+            fdata,
+        )
+    except NotFittedError:
+        estimator.fit(fdata)
+
+
+def _get_legend_patches(
+    colors: Sequence[ColorLike],
+    labels: Sequence[str],
+) -> Sequence[mpatches.Patch]:
+    """Build one legend patch per cluster."""
+    return [
+        mpatches.Patch(color=color, label=label)
+        for color, label in zip(colors, labels)
+    ]
+
+
 def _get_labels(
     x_label: str | None,
     y_label: str | None,
@@ -260,9 +293,9 @@ class ClusterPlot(BasePlot):
             ]
 
         if self.cluster_colors is None:
-            self.cluster_colors = self.colormap(
-                np.arange(self.estimator.n_clusters)
-                / (self.estimator.n_clusters - 1),
+            self.cluster_colors = _get_cluster_colors(
+                self.colormap,
+                self.estimator.n_clusters,
             )
 
         if self.cluster_labels is None:
@@ -271,7 +304,7 @@ class ClusterPlot(BasePlot):
             ]
 
         if self.center_colors is None:
-            self.center_colors = [_darken(c, 0.5) for c in self.cluster_colors]
+            self.center_colors = _darken_array(self.cluster_colors, 0.5)
 
         if self.center_labels is None:
             self.center_labels = [
@@ -280,39 +313,62 @@ class ClusterPlot(BasePlot):
 
         colors_by_cluster = np.asarray(self.cluster_colors)[self.labels]
 
-        patches = [
-            mpatches.Patch(
-                color=self.cluster_colors[i],
-                label=self.cluster_labels[i],
-            )
-            for i in range(self.estimator.n_clusters)
-        ]
-
-        artists = [
-            axes[j].plot(
-                self.fdata.grid_points[0],
-                self.fdata.data_matrix[i, :, j],
-                c=colors_by_cluster[i],
-                label=self.sample_labels[i],
-            )
-            for j in range(self.fdata.dim_codomain)
-            for i in range(self.fdata.n_samples)
-        ]
+        patches = _get_legend_patches(
+            self.cluster_colors,
+            self.cluster_labels,
+        )
 
-        self.artists = np.array(artists).reshape(
-            (self.n_subplots, self.n_samples),
-        ).T
+        self.artists = np.full(
+            (self.n_samples, self.n_subplots),
+            None,
+            dtype=Artist,
+        )
+
+        grid_points = self.fdata.grid_points[0]
+
+        # One transposition up front leaves a contiguous (n, t) block
+        # per codomain dimension, instead of a strided slice per
+        # dimension inside the loop.
+        data_by_dim = np.ascontiguousarray(
+            np.moveaxis(self.fdata.data_matrix, -1, 0),
+        )
+        centers_by_dim = np.ascontiguousarray(
+            np.moveaxis(self.estimator.cluster_centers_.data_matrix, -1, 0),
+        )
 
         for j in range(self.fdata.dim_codomain):
 
-            for i in range(self.estimator.n_clusters):
-                axes[j].plot(
-                    self.fdata.grid_points[0],
-                    self.estimator.cluster_centers_.data_matrix[i, :, j],
-                    c=self.center_colors[i],
-                    label=self.center_labels[i],
-                    linewidth=self.center_width,
-                )
+            # A single collection per axes draws all the samples at
+            # once, instead of one artist per (sample, dimension) pair.
+            sample_values = data_by_dim[j]
+            samples_collection = LineCollection(
+                np.stack(
+                    [
+                        np.broadcast_to(grid_points, sample_values.shape),
+                        sample_values,
+                    ],
+                    axis=-1,
+                ),
+                colors=colors_by_cluster,
+            )
+            axes[j].add_collection(samples_collection)
+            self.artists[:, j] = samples_collection
+
+            center_values = centers_by_dim[j]
+            centers_collection = LineCollection(
+                np.stack(
+                    [
+                        np.broadcast_to(grid_points, center_values.shape),
+                        center_values,
+                    ],
+                    axis=-1,
+                ),
+                colors=self.center_colors,
+                linewidths=self.center_width,
+            )
+            axes[j].add_collection(centers_collection)
+
+            axes[j].autoscale_view()
             axes[j].legend(handles=patches)
 
         _set_labels(self.fdata, fig, axes)
@@ -323,14 +379,7 @@ class ClusterPlot(BasePlot):
         axes: Sequence[Axes],
     ) -> None:
 
-        try:
-            check_is_fitted(self.estimator)
-            check_fdata_same_dimensions(
-                self.estimator.cluster_centers_,
-                self.fdata,
-            )
-        except NotFittedError:
-            self.estimator.fit(self.fdata)
+        _fit_if_needed(self.estimator, self.fdata)
 
         self.labels = self.estimator.labels_
 
@@ -412,14 +461,7 @@ class ClusterMembershipLinesPlot(BasePlot):
         axes: Sequence[Axes],
     ) -> None:
 
-        try:
-            check_is_fitted(self.estimator)
-            check_fdata_same_dimensions(
-                self.estimator.cluster_centers_,
-                self.fdata,
-            )
-        except NotFittedError:
-            self.estimator.fit(self.fdata)
+        _fit_if_needed(self.estimator, self.fdata)
 
         membership = self.estimator.predict_proba(self.fdata)
 
@@ -442,9 +484,9 @@ class ClusterMembershipLinesPlot(BasePlot):
         )
 
         if self.sample_colors is None:
-            self.cluster_colors = self.colormap(
-                np.arange(self.estimator.n_clusters)
-                / (self.estimator.n_clusters - 1),
+            self.cluster_colors = _get_cluster_colors(
+                self.colormap,
+                self.estimator.n_clusters,
             )
             labels_by_cluster = self.estimator.labels_
             self.sample_colors = self.cluster_colors[labels_by_cluster]
@@ -462,15 +504,28 @@ class ClusterMembershipLinesPlot(BasePlot):
             ]
 
         axes[0].get_xaxis().set_major_locator(MaxNLocator(integer=True))
-        self.artists = np.array([
-            axes[0].plot(
-                np.arange(self.estimator.n_clusters),
-                membership[i],
-                label=self.sample_labels[i],
-                color=self.sample_colors[i],
-            )
-            for i in range(self.fdata.n_samples)
-        ])
+
+        # A single collection with one line per sample, instead of one
+        # plot call (and artist) per sample.
+        cluster_indices = np.arange(self.estimator.n_clusters)
+        membership_lines = LineCollection(
+            np.stack(
+                [
+                    np.broadcast_to(cluster_indices, membership.shape),
+                    membership,
+                ],
+                axis=-1,
+            ),
+            colors=self.sample_colors,
+        )
+        axes[0].add_collection(membership_lines)
+        axes[0].autoscale_view()
+
+        self.artists = np.full(
+            (self.n_samples, 1),
+            membership_lines,
+            dtype=Artist,
+        )
 
         axes[0].set_xticks(np.arange(self.estimator.n_clusters))
         axes[0].set_xticklabels(self.cluster_labels)
@@ -567,14 +622,7 @@ class ClusterMembershipPlot(BasePlot):
             dtype=Artist,
         )
 
-        try:
-            check_is_fitted(self.estimator)
-            check_fdata_same_dimensions(
-                self.estimator.cluster_centers_,
-                self.fdata,
-            )
-        except NotFittedError:
-            self.estimator.fit(self.fdata)
+        _fit_if_needed(self.estimator, self.fdata)
 
         membership = self.estimator.predict_proba(self.fdata)
 
@@ -611,9 +659,9 @@ class ClusterMembershipPlot(BasePlot):
 
         if self.cluster_colors is None:
             self.cluster_colors = list(
-                self.colormap(
-                    np.arange(self.estimator.n_clusters)
-                    / (self.estimator.n_clusters - 1),
+                _get_cluster_colors(
+                    self.colormap,
+                    self.estimator.n_clusters,
                 ),
             )
 
@@ -623,65 +671,69 @@ class ClusterMembershipPlot(BasePlot):
                 for i in range(self.estimator.n_clusters)
             ]
 
-        patches = [
-            mpatches.Patch(
-                color=self.cluster_colors[i],
-                label=self.cluster_labels[i],
-            )
-            for i in range(self.estimator.n_clusters)
-        ]
+        patches = _get_legend_patches(
+            self.cluster_colors,
+            self.cluster_labels,
+        )
+
+        cluster_colors = np.asarray(self.cluster_colors)
 
         if self.sort == -1:
             labels_dim = membership
         else:
-            sample_indices = np.argsort(-membership[:, self.sort])
+            # Reversing the ascending order avoids negating a copy of
+            # the column just to sort it descendingly.
+            sample_indices = np.argsort(membership[:, self.sort])[::-1]
             self.sample_labels = list(
-                np.array(self.sample_labels)[sample_indices],
+                np.take(np.asarray(self.sample_labels), sample_indices),
             )
-            labels_dim = np.copy(membership[sample_indices])
 
-            temp_labels = np.copy(labels_dim[:, 0])
-            labels_dim[:, 0] = labels_dim[:, self.sort]
-            labels_dim[:, self.sort] = temp_labels
+            # Swap the sorting cluster to the first position with a
+            # single permuted gather.
+            permutation = np.arange(self.estimator.n_clusters)
+            permutation[[0, self.sort]] = permutation[[self.sort, 0]]
 
-            # Swap
-            self.cluster_colors[0], self.cluster_colors[self.sort] = (
-                self.cluster_colors[self.sort],
-                self.cluster_colors[0],
-            )
+            labels_dim = membership[np.ix_(sample_indices, permutation)]
+            cluster_colors = cluster_colors[permutation]
 
-        conc = np.zeros((self.fdata.n_samples, 1))
-        labels_dim = np.concatenate((conc, labels_dim), axis=-1)
-        bars = [
-            axes[0].bar(
-                np.arange(self.fdata.n_samples),
-                labels_dim[:, i + 1],
-                bottom=np.sum(labels_dim[:, :(i + 1)], axis=1),
-                color=self.cluster_colors[i],
-            )
-            for i in range(self.estimator.n_clusters)
-        ]
-
-        for b in bars:
-            b.remove()
-            b.figure = None
-
-        for i in range(self.n_samples):
-            collection = PatchCollection(
-                [
-                    Rectangle(
-                        bar.patches[i].get_xy(),
-                        bar.patches[i].get_width(),
-                        bar.patches[i].get_height(),
-                        color=bar.patches[i].get_facecolor(),
-                    ) for bar in bars
-                ],
-                match_original=True,
-            )
-            axes[0].add_collection(collection)
-            self.artists[i, 0] = collection
-
-        fig.canvas.draw()
+        # Cumulative memberships give every bar bottom in one pass.
+        # Only the first column needs zeroing; the cumsum overwrites
+        # the rest, so a full zero-fill would be wasted writes.
+        bottoms = np.empty(
+            (self.fdata.n_samples, self.estimator.n_clusters),
+        )
+        bottoms[:, 0] = 0
+        np.cumsum(labels_dim[:, :-1], axis=-1, out=bottoms[:, 1:])
+
+        # One collection holding every bar segment, instead of drawing
+        # n_clusters bar charts just to regroup their rectangles into
+        # one patch collection per sample.
+        tops = bottoms + labels_dim
+        bar_width = 0.8
+        lefts = np.arange(self.fdata.n_samples) - bar_width / 2
+        x0 = np.broadcast_to(
+            lefts[:, np.newaxis],
+            labels_dim.shape,
+        )
+        x1 = x0 + bar_width
+        vertices = np.stack(
+            [
+                np.stack([x0, x1, x1, x0], axis=-1),
+                np.stack([bottoms, bottoms, tops, tops], axis=-1),
+            ],
+            axis=-1,
+        ).reshape(-1, 4, 2)
+
+        bars_collection = PolyCollection(
+            vertices,
+            facecolors=np.tile(
+                matplotlib.colors.to_rgba_array(cluster_colors),
+                (self.fdata.n_samples, 1),
+            ),
+        )
+        axes[0].add_collection(bars_collection)
+        axes[0].autoscale_view()
+        self.artists[:, 0] = bars_collection
 
         axes[0].set_xticks(np.arange(self.fdata.n_samples))
         axes[0].set_xticklabels(self.sample_labels)
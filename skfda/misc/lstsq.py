@@ -5,6 +5,7 @@ from typing import Callable, Optional, Union
 
 import numpy as np
 import scipy.linalg
+from scipy.linalg.blas import get_blas_funcs
 from typing_extensions import Final, Literal
 
 from ..typing._numpy import NDArrayFloat
@@ -14,12 +15,24 @@ LstsqMethodName = Literal["cholesky", "qr", "svd"]
 LstsqMethod = Union[LstsqMethodCallable, LstsqMethodName]
 
 
+def _symmetric_gram(coefs: NDArrayFloat) -> NDArrayFloat:
+    """
+    Compute ``coefs.T @ coefs`` as a symmetric rank-k update.
+
+    The BLAS ``syrk`` routine fills only the upper triangle, halving
+    the flops of a general matrix product; that triangle is the one
+    read by :func:`scipy.linalg.solve` with ``assume_a="pos"``.
+    """
+    syrk = get_blas_funcs('syrk', (coefs,))
+    return syrk(1.0, coefs, trans=1)  # type: ignore[no-any-return]
+
+
 def lstsq_cholesky(
     coefs: NDArrayFloat,
     result: NDArrayFloat,
 ) -> NDArrayFloat:
     """Solve OLS problem using a Cholesky decomposition."""
-    left = coefs.T @ coefs
+    left = _symmetric_gram(coefs)
     right = coefs.T @ result
     return scipy.linalg.solve(  # type: ignore[no-any-return]
         left,
@@ -68,7 +81,7 @@ def _get_lstsq_method(
 
 def solve_regularized_weighted_lstsq(
     coefs: NDArrayFloat,
-    result: NDArrayFloat,
+    result: Optional[NDArrayFloat],
     *,
     weights: Optional[NDArrayFloat] = None,
     penalty_matrix: Optional[NDArrayFloat] = None,
@@ -80,6 +93,10 @@ def solve_regularized_weighted_lstsq(
     If weights is a 1-D array it is converted to 2-D array with weights on the
     diagonal.
 
+    If ``result`` is ``None`` it is taken to be the identity matrix, so
+    that the solution maps results to solved coefficients, without the
+    identity ever being materialized where the solver allows it.
+
     If the penalty matrix is not ``None`` and nonzero, there
     is a closed solution. Otherwise the problem can be reduced
     to a least squares problem.
@@ -96,21 +113,36 @@ def solve_regularized_weighted_lstsq(
             if weights.ndim == 1:
                 weights_chol = np.diag(np.sqrt(weights))
                 coefs = weights_chol * coefs
-                result = weights_chol * result
+                result = (
+                    weights_chol
+                    if result is None
+                    else weights_chol * result
+                )
             else:
                 weights_chol = scipy.linalg.cholesky(weights)
                 coefs = weights_chol @ coefs
-                result = weights_chol @ result
+                result = (
+                    weights_chol
+                    if result is None
+                    else weights_chol @ result
+                )
+
+        if result is None:
+            result = np.eye(coefs.shape[0])
 
         return lstsq_method(coefs, result)
 
     # Cholesky case (always used for the regularized case)
     if weights is None:
-        left = coefs.T @ coefs
-        right = coefs.T @ result
+        left = _symmetric_gram(coefs)
+        right = coefs.T if result is None else coefs.T @ result
     else:
         left = coefs.T @ weights @ coefs
-        right = coefs.T @ weights @ result
+        right = (
+            coefs.T @ weights
+            if result is None
+            else coefs.T @ weights @ result
+        )
 
     if penalty_matrix is not None:
         left += penalty_matrix
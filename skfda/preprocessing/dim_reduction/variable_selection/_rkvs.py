@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Tuple
 
 import numpy as np
-import numpy.linalg as linalg
+import scipy.linalg
 import sklearn.utils.validation
 
 from ...._utils import _classifier_get_classes
@@ -12,7 +12,7 @@ from ...._utils._sklearn_adapter import (
     InductiveTransformerMixin,
 )
 from ....representation import FDataGrid
-from ....typing._numpy import NDArrayFloat, NDArrayInt
+from ....typing._numpy import DTypeLike, NDArrayFloat, NDArrayInt
 
 
 def _rkhs_vs(
@@ -25,7 +25,7 @@ def _rkhs_vs(
 
     Parameters:
         X: Matrix of trajectories
-        Y: Vector of class labels
+        Y: Vector of class labels, encoded as 0 and 1
         n_features_to_select: Number of selected features
 
     Returns:
@@ -36,67 +36,115 @@ def _rkhs_vs(
     assert n_features_to_select >= 1
     assert n_features_to_select <= X.shape[1]
 
-    _, Y = _classifier_get_classes(Y)
-
     selected_features = np.zeros(n_features_to_select, dtype=int)
     score = np.zeros(n_features_to_select)
-    indexes = np.arange(0, X.shape[1])
-
-    # Calculate means and covariance matrix
-    class_1_trajectories = X[Y.ravel() == 1]
-    class_0_trajectories = X[Y.ravel() == 0]
-
-    means = (
-        np.mean(class_1_trajectories, axis=0)
-        - np.mean(class_0_trajectories, axis=0)
+    candidates_mask = np.ones(X.shape[1], dtype=bool)
+
+    # Calculate the class means without copying X into per-class blocks
+    y = Y.ravel()
+    class_1_mask = y == 1
+    n_samples = y.shape[0]
+    n_class_1 = np.count_nonzero(class_1_mask)
+
+    total_sum = X.sum(axis=0)
+    class_1_sum = class_1_mask.astype(X.dtype) @ X
+    class_1_mean = class_1_sum / n_class_1
+    class_0_mean = (total_sum - class_1_sum) / (n_samples - n_class_1)
+
+    means = class_1_mean - class_0_mean
+
+    # Centering each trajectory by its class mean makes X_c^T X_c / n
+    # exactly the proportion-weighted sum of the biased per-class
+    # covariances, computed with a single symmetric product instead of
+    # two independent covariance passes over copies of X.
+    centered = X - np.where(
+        class_1_mask[:, np.newaxis],
+        class_1_mean,
+        class_0_mean,
     )
-
-    class_1_count = sum(Y)
-    class_0_count = Y.shape[0] - class_1_count
-
-    class_1_proportion = class_1_count / Y.shape[0]
-    class_0_proportion = class_0_count / Y.shape[0]
-
-    # The result should be casted to 2D because of bug #11502 in numpy
-    variances = (
-        class_1_proportion * np.atleast_2d(
-            np.cov(class_1_trajectories, rowvar=False, bias=True),
-        )
-        + class_0_proportion * np.atleast_2d(
-            np.cov(class_0_trajectories, rowvar=False, bias=True),
-        )
+    variances = centered.T @ centered / n_samples
+
+    # The first variable maximizes |mu(t)|/sigma(t). Variables with
+    # zero pooled variance (e.g. a point where every trajectory takes
+    # the same value) carry no information and are scored as zero.
+    # np.diag returns a strided view; a contiguous copy makes the
+    # repeated gathers in the greedy loop stride-1 loads.
+    var_diag = np.ascontiguousarray(np.diag(variances))
+    positive_variance = var_diag > 0
+    mu_sigma = np.zeros_like(means)
+    mu_sigma[positive_variance] = (
+        np.abs(means[positive_variance])
+        / np.sqrt(var_diag[positive_variance])
     )
 
-    # The first variable maximizes |mu(t)|/sigma(t)
-    mu_sigma = np.abs(means) / np.sqrt(np.diag(variances))
-
     selected_features[0] = np.argmax(mu_sigma)
     score[0] = mu_sigma[selected_features[0]]
-    indexes = np.delete(indexes, selected_features[0])
+    candidates_mask[selected_features[0]] = False
+
+    # Maintain the Cholesky factor L of the covariance submatrix of the
+    # selected variables, grown by one row per iteration, together with
+    # the whitened mean differences u = L^{-1} m, so that the Mahalanobis
+    # score of the current selection is ||u||^2.
+    # The factor only spans the selected variables that are linearly
+    # independent, so that its pivots stay positive.
+    first_feature = selected_features[0]
+    factor_features = [first_feature]
+    l_factor = np.sqrt(variances[first_feature, first_feature]).reshape(1, 1)
+    whitened_means = means[[first_feature]] / l_factor[0]
+    current_score = whitened_means[0]**2
+    tolerance = np.finfo(l_factor.dtype).eps * X.shape[1]
 
     for i in range(1, n_features_to_select):
-        aux = np.zeros_like(indexes, dtype=np.float64)
-
-        for j in range(0, indexes.shape[0]):
-            new_selection = np.concatenate([
-                selected_features[:i],
-                [indexes[j]],
-            ])
-
-            new_means = means[new_selection]
-
-            lstsq_solution = linalg.lstsq(
-                variances[new_selection[:, np.newaxis], new_selection],
-                new_means.T,
-                rcond=None,
-            )[0]
+        # Adding a candidate j to the selection S changes the score to
+        # phi(S) + (m_j - w^T u)^2 / (K_jj - w^T w), with
+        # w = L^{-1} K_{S, j} (Schur complement of K_jj in the augmented
+        # covariance submatrix). One triangular solve thus scores every
+        # candidate at once, instead of factorizing a near-identical
+        # submatrix from scratch per candidate.
+        indexes = np.flatnonzero(candidates_mask)
+        covariances = variances[np.ix_(factor_features, indexes)]
+        w = scipy.linalg.solve_triangular(
+            l_factor,
+            covariances,
+            lower=True,
+            check_finite=False,
+        )
+        schur_complements = var_diag[indexes] - np.einsum('ij,ij->j', w, w)
+        residuals = means[indexes] - whitened_means @ w
+
+        # A candidate that is (numerically) a linear combination of
+        # the selected variables has a vanishing Schur complement: it
+        # adds no separation, which is the pseudo-inverse limit of the
+        # score, and it cannot enter the Cholesky factor.
+        independent = schur_complements > var_diag[indexes] * tolerance
+        gains = np.zeros_like(schur_complements)
+        gains[independent] = (
+            residuals[independent]**2 / schur_complements[independent]
+        )
 
-            aux[j] = new_means @ lstsq_solution
+        aux = current_score + gains
 
         aux2 = np.argmax(aux)
         selected_features[i] = indexes[aux2]
         score[i] = aux[aux2]
-        indexes = np.delete(indexes, aux2)
+        current_score = aux[aux2]
+
+        if independent[aux2]:
+            # Grow the Cholesky factor and whitened means with the
+            # chosen variable.
+            size = l_factor.shape[0]
+            new_l_factor = np.zeros((size + 1, size + 1), dtype=l_factor.dtype)
+            new_l_factor[:size, :size] = l_factor
+            new_l_factor[size, :size] = w[:, aux2]
+            new_l_factor[size, size] = np.sqrt(schur_complements[aux2])
+            l_factor = new_l_factor
+            whitened_means = np.append(
+                whitened_means,
+                residuals[aux2] / l_factor[size, size],
+            )
+            factor_features.append(selected_features[i])
+
+        candidates_mask[selected_features[i]] = False
 
     return selected_features, score
 
@@ -140,6 +188,11 @@ class RKHSVariableSelection(
 
     Parameters:
         n_features_to_select: number of features to select.
+        dtype: Dtype used for the internal computations. The selection
+            is a greedy argmax over scores estimated from finite
+            samples, so a ``np.float32`` dtype halves the memory
+            traffic of the covariance step at a negligible cost in the
+            choice of variables. By default ``np.float64``.
 
     Examples:
         >>> from skfda.preprocessing.dim_reduction import variable_selection
@@ -193,8 +246,14 @@ class RKHSVariableSelection(
 
     """
 
-    def __init__(self, n_features_to_select: int = 1) -> None:
+    def __init__(
+        self,
+        n_features_to_select: int = 1,
+        *,
+        dtype: DTypeLike = np.float64,
+    ) -> None:
         self.n_features_to_select = n_features_to_select
+        self.dtype = dtype
 
     def fit(  # type: ignore[override] # noqa: D102
         self,
@@ -202,18 +261,21 @@ class RKHSVariableSelection(
         y: NDArrayInt,
     ) -> RKHSVariableSelection:
 
-        n_unique_labels = len(np.unique(y))
-        if n_unique_labels != 2:
-            raise ValueError(
-                f"RK-VS can only be used when there are only "
-                f"two different labels, but there are "
-                f"{n_unique_labels}",
-            )
-
         if X.dim_domain != 1 or X.dim_codomain != 1:
             raise ValueError("Domain and codomain dimensions must be 1")
 
         X, y = sklearn.utils.validation.check_X_y(X.data_matrix[..., 0], y)
+        X = X.astype(self.dtype, copy=False)
+
+        # Encode the labels once, instead of a np.unique scan here and
+        # a second encoding pass inside _rkhs_vs.
+        classes, y = _classifier_get_classes(y)
+        if classes.size != 2:
+            raise ValueError(
+                f"RK-VS can only be used when there are only "
+                f"two different labels, but there are "
+                f"{classes.size}",
+            )
 
         self._features_shape_ = X.shape[1:]
 
@@ -226,6 +288,11 @@ class RKHSVariableSelection(
         self._features_ = features
         self._scores_ = scores
 
+        # Materialized once, so that get_support does not rebuild it on
+        # every call.
+        self._support_mask_ = np.zeros(self._features_shape_[0], dtype=bool)
+        self._support_mask_[features] = True
+
         return self
 
     def transform(  # noqa: D102
@@ -244,7 +311,7 @@ class RKHSVariableSelection(
                 "points than the ones fitted",
             )
 
-        return X_matrix[:, self._features_]  # type: ignore[no-any-return]
+        return np.take(X_matrix, self._features_, axis=1)
 
     def get_support(self, indices: bool = False) -> NDArrayInt:
         """
@@ -264,10 +331,7 @@ class RKHSVariableSelection(
             whose values are indices into the input feature vector.
 
         """
-        features = self._features_
         if indices:
-            return features
+            return self._features_
 
-        mask = np.zeros(self._features_shape_[0], dtype=bool)
-        mask[features] = True
-        return mask
+        return self._support_mask_.copy()
@@ -6,6 +6,7 @@ from typing import Any, Mapping, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from sklearn.base import clone
 from sklearn.utils.validation import check_is_fitted as sklearn_check_is_fitted
 
@@ -64,6 +65,11 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
         array_output:
             Indicates if the transformed data is requested to be a NumPy array
             output. By default the value is False.
+        n_jobs:
+            Number of jobs used to transform the classes in parallel
+            using threads, as the per-class transformations are
+            independent. ``None`` (the default) transforms them
+            sequentially and ``-1`` uses all processors.
 
     Examples:
         Firstly, we will import the Berkeley Growth Study dataset:
@@ -158,9 +164,11 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
         transformer: TransformerMixin[Input, TransformerOutput, object],
         *,
         array_output: bool = False,
+        n_jobs: int | None = None,
     ) -> None:
         self.transformer = transformer
         self.array_output = array_output
+        self.n_jobs = n_jobs
 
     def _more_tags(self) -> Mapping[str, Any]:
         parent_tags = super()._more_tags()
@@ -262,10 +270,19 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
         """
         sklearn_check_is_fitted(self)
 
-        transformed_data = [
-            feature_transformer.transform(X)
-            for feature_transformer in self._class_feature_transformers_
-        ]
+        if self.n_jobs is None:
+            transformed_data = [
+                feature_transformer.transform(X)
+                for feature_transformer in self._class_feature_transformers_
+            ]
+        else:
+            # The per-class transformations are independent and spend
+            # their time in NumPy code that releases the GIL, so threads
+            # avoid serializing X once per class.
+            transformed_data = Parallel(n_jobs=self.n_jobs, prefer='threads')(
+                delayed(feature_transformer.transform)(X)
+                for feature_transformer in self._class_feature_transformers_
+            )
 
         if self.array_output:
             for data in transformed_data:
@@ -278,6 +295,14 @@ class PerClassTransformer(TransformerMixin[Input, Output, NDArrayInt]):
 
             return np.hstack(transformed_data)  # type: ignore[return-value]
 
+        if all(isinstance(data, np.ndarray) for data in transformed_data):
+            # Stack the per-class columns at once instead of wrapping
+            # each one in its own DataFrame and concatenating the frames.
+            return pd.DataFrame(  # type: ignore[no-any-return]
+                np.column_stack(transformed_data),
+                columns=['0'] * len(transformed_data),
+            )
+
         return pd.concat(  # type: ignore[no-any-return]
             [
                 pd.DataFrame({'0': data})  # noqa: WPS441
@@ -12,7 +12,12 @@ import numpy as np
 from typing_extensions import Final
 
 from ..._utils import _cartesian_product, _to_grid_points
-from ...misc.lstsq import LstsqMethod, solve_regularized_weighted_lstsq
+from ...misc.lstsq import (
+    LstsqMethod,
+    _get_lstsq_method,
+    lstsq_cholesky,
+    solve_regularized_weighted_lstsq,
+)
 from ...misc.regularization import L2Regularization
 from ...representation import FData, FDataBasis, FDataGrid, FDataIrregular
 from ...representation.basis import Basis
@@ -232,13 +237,15 @@ class BasisSmoother(_LinearSmoother):
         eval_points: NDArrayFloat,
         *,
         function_values: NDArrayFloat | None = None,
+        basis_values_input: NDArrayFloat | None = None,
     ) -> NDArrayFloat:
         """Get the matrix that gives the coefficients."""
         from ...misc.regularization import compute_penalty_matrix
 
-        basis_values_input = self.basis(
-            eval_points,
-        ).reshape((self.basis.n_basis, -1)).T
+        if basis_values_input is None:
+            basis_values_input = self.basis(
+                eval_points,
+            ).reshape((self.basis.n_basis, -1)).T
 
         penalty_matrix = compute_penalty_matrix(
             basis_iterable=(self.basis,),
@@ -246,11 +253,9 @@ class BasisSmoother(_LinearSmoother):
             regularization=self.regularization,
         )
 
-        # Get the matrix for computing the coefficients if no
-        # function_values is passed
-        if function_values is None:
-            function_values = np.eye(basis_values_input.shape[0])
-
+        # If function_values is None the solver returns the matrix
+        # mapping function values to coefficients, without building an
+        # identity right-hand side.
         return solve_regularized_weighted_lstsq(
             coefs=basis_values_input,
             result=function_values,
@@ -264,14 +269,24 @@ class BasisSmoother(_LinearSmoother):
         input_points: GridPointsLike,
         output_points: GridPointsLike,
     ) -> NDArrayFloat:
+        input_points = _to_grid_points(input_points)
+        output_points = _to_grid_points(output_points)
+
         basis_values_output = self.basis(
-            _cartesian_product(
-                _to_grid_points(output_points),
-            ),
+            _cartesian_product(output_points),
         ).reshape((self.basis.n_basis, -1)).T
 
+        # By default the output points are the input points, in which
+        # case the same basis evaluation serves both sides of the
+        # product.
+        same_points = len(input_points) == len(output_points) and all(
+            np.array_equal(i, o)
+            for i, o in zip(input_points, output_points)
+        )
+
         return basis_values_output @ self._coef_matrix(
-            _cartesian_product(_to_grid_points(input_points)),
+            _cartesian_product(input_points),
+            basis_values_input=basis_values_output if same_points else None,
         )
 
     def fit(
@@ -296,7 +311,29 @@ class BasisSmoother(_LinearSmoother):
             else self.input_points_
         )
 
-        if not self.return_basis:
+        if self.return_basis:
+            # Cache the matrix mapping function values at the input
+            # points to basis coefficients, so that repeated transforms
+            # reuse the basis evaluation and the factorization, just as
+            # _LinearSmoother.fit caches the hat matrix. Only the
+            # normal-equation path produces that matrix without
+            # materializing an identity right-hand side (an n_points^2
+            # allocation) and without altering the minimum-norm
+            # solution of the plain lstsq methods, so the others keep
+            # solving directly against the function values.
+            uses_normal_equations = (
+                _get_lstsq_method(self.method) is lstsq_cholesky
+                or (
+                    self.regularization is not None
+                    and self.smoothing_parameter != 0
+                )
+            )
+            self._cached_coef_matrix_ = (
+                self._coef_matrix(X._get_points_and_values()[0])
+                if uses_normal_equations
+                else None
+            )
+        else:
             super().fit(X, y)
 
         return self
@@ -317,20 +354,33 @@ class BasisSmoother(_LinearSmoother):
             Smoothed data.
 
         """
-        assert all(
-            np.array_equal(i, s) for i, s in zip(
-                self.input_points_,
-                X._get_input_points(),
+        input_points = X._get_input_points()
+
+        # Usually the very same grid object is passed at fit and
+        # transform time, so the identity checks skip the elementwise
+        # comparison. An explicit raise is used instead of an assert,
+        # which would be stripped when running with -O.
+        if input_points is not self.input_points_ and not all(
+            i is s or np.array_equal(i, s)
+            for i, s in zip(self.input_points_, input_points)
+        ):
+            raise ValueError(
+                "The input points of X do not match "
+                "the ones used at fit time.",
             )
-        )
-
-        eval_points, function_values = X._get_points_and_values()
 
         if self.return_basis:
-            coefficients = self._coef_matrix(
-                eval_points=eval_points,
-                function_values=function_values,
-            ).T
+            eval_points, function_values = X._get_points_and_values()
+
+            if self._cached_coef_matrix_ is None:
+                coefficients = self._coef_matrix(
+                    eval_points=eval_points,
+                    function_values=function_values,
+                ).T
+            else:
+                coefficients = (
+                    self._cached_coef_matrix_ @ function_values
+                ).T
 
             return FDataBasis(
                 basis=self.basis,
@@ -7,6 +7,7 @@ from skfda import FDataGrid
 from skfda.exploratory.depth.multivariate import SimplicialDepth
 from skfda.exploratory.outliers import (
     MSPlotOutlierDetector,
+    OutliergramOutlierDetector,
     directional_outlyingness_stats,
 )
 
@@ -71,5 +72,58 @@ class TestsDirectionalOutlyingness(unittest.TestCase):
         )
 
 
+class TestOutliergramOutlierDetector(unittest.TestCase):
+    """Tests for the outliergram-based outlier detector."""
+
+    def setUp(self) -> None:
+        """Create a dataset with one shape outlier."""
+        data_matrix = [
+            [0, 0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1, 1],
+            [2, 2, 2, 2, 2, 2],
+            [3, 3, 3, 3, 3, 3],
+            [9, 9, 9, -1, -1, -1],
+            [4, 4, 4, 4, 4, 4],
+            [5, 5, 5, 5, 5, 5],
+            [6, 6, 6, 6, 6, 6],
+            [7, 7, 7, 7, 7, 7],
+            [8, 8, 8, 8, 8, 8],
+        ]
+        grid_points = [0, 2, 4, 6, 8, 10]
+        self.fd = FDataGrid(data_matrix, grid_points)
+
+    def test_fitted_attributes(self) -> None:
+        """Check that the fitted attributes agree with the prediction."""
+        out_detector = OutliergramOutlierDetector()
+        prediction = out_detector.fit_predict(self.fd)
+
+        np.testing.assert_array_equal(
+            out_detector.outliers_,
+            prediction == -1,
+        )
+        self.assertEqual(
+            out_detector.n_outliers_,
+            np.count_nonzero(prediction == -1),
+        )
+        np.testing.assert_allclose(
+            out_detector.parabola_,
+            out_detector.distances_ + out_detector.mbd_,
+        )
+
+    def test_dtype(self) -> None:
+        """Check that the dtype parameter controls the stored arrays."""
+        out_detector = OutliergramOutlierDetector(dtype=np.float32)
+        prediction = out_detector.fit_predict(self.fd)
+
+        self.assertEqual(out_detector.mbd_.dtype, np.float32)
+        self.assertEqual(out_detector.mei_.dtype, np.float32)
+        self.assertEqual(out_detector.distances_.dtype, np.float32)
+
+        np.testing.assert_array_equal(
+            prediction,
+            OutliergramOutlierDetector().fit_predict(self.fd),
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 
 import numpy as np
+import pandas as pd
 
 from skfda._utils import _classifier_get_classes
 from skfda.datasets import fetch_growth
@@ -11,6 +12,7 @@ from skfda.preprocessing.dim_reduction.variable_selection import (
     RecursiveMaximaHunting,
 )
 from skfda.preprocessing.feature_construction import PerClassTransformer
+from skfda.preprocessing.smoothing import KernelSmoother
 from skfda.representation import FDataGrid
 
 
@@ -44,6 +46,39 @@ class TestPerClassTransformer(unittest.TestCase):
 
         np.testing.assert_array_equal(transformed, manual)
 
+    def test_n_jobs(self) -> None:
+        """Check that parallel transformation matches the sequential one."""
+        t_array = PerClassTransformer[
+            FDataGrid,
+            np.typing.NDArray[np.float64],
+        ](
+            RecursiveMaximaHunting(),
+            array_output=True,
+        )
+        t_array.fit(self.X, self.y)
+
+        sequential = t_array.transform(self.X)
+        t_array.n_jobs = 2
+        parallel = t_array.transform(self.X)
+
+        np.testing.assert_array_equal(sequential, parallel)
+
+        t_frame = PerClassTransformer[FDataGrid, pd.DataFrame](
+            KernelSmoother(),
+        )
+        t_frame.fit(self.X, self.y)
+
+        sequential_frame = t_frame.transform(self.X)
+        t_frame.n_jobs = 2
+        parallel_frame = t_frame.transform(self.X)
+
+        self.assertEqual(sequential_frame.shape, parallel_frame.shape)
+        for column in range(sequential_frame.shape[1]):
+            np.testing.assert_array_equal(
+                sequential_frame.iloc[:, column].values.data_matrix,
+                parallel_frame.iloc[:, column].values.data_matrix,
+            )
+
     def test_not_transformer_argument(self) -> None:
         """Check that invalid arguments in fit raise exception."""
         t = PerClassTransformer[FDataGrid, np.typing.NDArray[np.float64]](
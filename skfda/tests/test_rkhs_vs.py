@@ -0,0 +1,98 @@
+"""Tests for Reproducing Kernel Hilbert Space Variable Selection (RK-VS)."""
+import unittest
+from typing import Tuple
+
+import numpy as np
+
+import skfda
+from skfda.datasets import make_gaussian_process
+from skfda.preprocessing.dim_reduction import variable_selection as vs
+
+
+class TestRKHSVariableSelection(unittest.TestCase):
+    """Tests for RK-VS."""
+
+    def _two_class_data(
+        self,
+    ) -> Tuple[skfda.FDataGrid, np.typing.NDArray[np.float64]]:
+        """Create two homoscedastic Brownian classes."""
+        n_samples = 1000
+        n_features = 101
+
+        def mean_1(  # noqa: WPS430
+            t: np.typing.NDArray[np.float64],
+        ) -> np.typing.NDArray[np.float64]:
+
+            return (  # type: ignore[no-any-return]
+                np.abs(t - 0.25)
+                - 2 * np.abs(t - 0.5)
+                + np.abs(t - 0.75)
+            )
+
+        X_0 = make_gaussian_process(
+            n_samples=n_samples // 2,
+            n_features=n_features,
+            random_state=0,
+        )
+        X_1 = make_gaussian_process(
+            n_samples=n_samples // 2,
+            n_features=n_features,
+            mean=mean_1,
+            random_state=1,
+        )
+        X = skfda.concatenate((X_0, X_1))
+
+        y = np.zeros(n_samples)
+        y[n_samples // 2:] = 1
+
+        return X, y
+
+    def test_dtype(self) -> None:
+        """Check that reduced precision selects the same variables."""
+        X, y = self._two_class_data()
+
+        rkvs_64 = vs.RKHSVariableSelection(n_features_to_select=3)
+        rkvs_64.fit(X, y)
+
+        rkvs_32 = vs.RKHSVariableSelection(
+            n_features_to_select=3,
+            dtype=np.float32,
+        )
+        rkvs_32.fit(X, y)
+
+        np.testing.assert_array_equal(
+            rkvs_32.get_support(indices=True),
+            rkvs_64.get_support(indices=True),
+        )
+        np.testing.assert_array_equal(
+            rkvs_32.transform(X),
+            rkvs_64.transform(X),
+        )
+
+    def test_singular_covariance(self) -> None:
+        """Check that linearly dependent variables are handled.
+
+        A duplicated or constant grid column makes the pooled covariance
+        matrix singular; the selection must still complete, with finite
+        scores and without picking any variable twice.
+        """
+        random_state = np.random.RandomState(0)
+        n_samples = 50
+        data_matrix = random_state.standard_normal((n_samples, 10))
+        data_matrix[:, 5] = data_matrix[:, 3]
+        data_matrix[:, 8] = 1
+
+        X = skfda.FDataGrid(data_matrix, np.linspace(0, 1, 10))
+        y = np.zeros(n_samples)
+        y[n_samples // 2:] = 1
+
+        rkvs = vs.RKHSVariableSelection(n_features_to_select=4)
+        rkvs.fit(X, y)
+        features = rkvs.get_support(indices=True)
+
+        self.assertEqual(len(set(features)), 4)
+        self.assertTrue(np.all(np.isfinite(rkvs._scores_)))  # noqa: WPS437
+
+
+if __name__ == '__main__':
+    unittest.main()
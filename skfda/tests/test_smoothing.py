@@ -287,6 +287,47 @@ class TestBasisSmoother(unittest.TestCase):
             np.array([[0.61, -0.88, 0.06, 0.02]]),
         )
 
+    def test_coefficient_cache(self) -> None:
+        """Test that the cached coefficient map matches a direct solve."""
+        t = np.linspace(0, 1, 9)
+        x = np.sin(2 * np.pi * t) + np.cos(2 * np.pi * t)
+        basis = BSplineBasis((0, 1), n_basis=5)
+
+        fd = FDataGrid(data_matrix=x, grid_points=t)
+
+        method_set: Tuple[Literal['cholesky', 'qr', 'svd'], ...] = (
+            'cholesky',
+            'qr',
+            'svd',
+        )
+        for method in method_set:
+            for smoothing_parameter in (0, 1):
+                with self.subTest(
+                    method=method,
+                    smoothing_parameter=smoothing_parameter,
+                ):
+                    smoother = smoothing.BasisSmoother(
+                        basis=basis,
+                        smoothing_parameter=smoothing_parameter,
+                        regularization=L2Regularization(
+                            LinearDifferentialOperator(2),
+                        ),
+                        method=method,
+                        return_basis=True,
+                    )
+
+                    fd_cached = smoother.fit(fd).transform(fd)
+
+                    # Discard the cache so that the transform solves
+                    # directly against the function values.
+                    smoother._cached_coef_matrix_ = None  # noqa: WPS437
+                    fd_direct = smoother.transform(fd)
+
+                    np.testing.assert_allclose(
+                        fd_cached.coefficients,
+                        fd_direct.coefficients,
+                    )
+
     def test_vector_valued_smoothing(self) -> None:
         """Test Basis Smoother for vector values functions."""
         X, _ = fetch_weather(return_X_y=True)